@@ -9,16 +9,17 @@ Creates a new Claude Code skill with proper frontmatter and structure.
 """
 
 import sys
-import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
+
+from skill_files import NAME_PATTERN
 
 # Valid Claude Code tools
-COMMON_TOOLS = [
+COMMON_TOOLS = (
     'Read', 'Write', 'Edit', 'Grep', 'Glob', 'Bash',
     'Agent', 'WebFetch', 'WebSearch', 'AskUserQuestion',
     'TaskCreate', 'TaskUpdate', 'TaskList', 'EnterPlanMode'
-]
+)
 
 
 class SkillGenerator:
@@ -53,7 +54,7 @@ class SkillGenerator:
             lines.append(line)
         return ' '.join(lines)
 
-    def prompt_list(self, prompt: str, options: List[str]) -> List[str]:
+    def prompt_list(self, prompt: str, options: Sequence[str]) -> List[str]:
         """Prompt for selecting multiple items from a list."""
         print(f"\n{prompt}")
         print("Available options:")
@@ -65,7 +66,7 @@ class SkillGenerator:
             selection = input("> ").strip().lower()
 
             if selection == 'all':
-                return options
+                return list(options)
 
             if not selection:
                 return []
@@ -79,7 +80,7 @@ class SkillGenerator:
 
     def validate_name(self, name: str) -> bool:
         """Validate skill name format."""
-        if not re.match(r'^[a-z0-9\-:]+$', name):
+        if not NAME_PATTERN.match(name):
             print("❌ Name should use lowercase, hyphens, and colons only")
             return False
         return True
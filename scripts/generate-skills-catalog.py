@@ -14,12 +14,15 @@ Creates markdown documentation with:
 - Skill dependency graph
 """
 
+import io
 import sys
 from pathlib import Path
 from typing import Dict, List, Set, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
 import yaml
 
+from skill_files import find_skill_files
+
 
 class SkillCatalog:
     def __init__(self, skills_dir: Path):
@@ -28,7 +31,7 @@ class SkillCatalog:
 
     def find_all_skills(self) -> List[Path]:
         """Find all SKILL.md files recursively."""
-        return sorted(self.skills_dir.rglob('SKILL.md'))
+        return find_skill_files(self.skills_dir)
 
     def parse_skill(self, file_path: Path) -> Optional[Dict]:
         """Parse a single SKILL.md file."""
@@ -45,18 +48,26 @@ class SkillCatalog:
             frontmatter = yaml.safe_load(parts[1])
 
             # Extract first paragraph from body as summary
-            body_lines = parts[2].strip().split('\n')
             summary = None
-            for line in body_lines:
+            for line in io.StringIO(parts[2]):
                 line = line.strip()
                 if line and not line.startswith('#'):
                     summary = line
                     break
 
+            # Category is the name prefix before the first colon, derived
+            # once here for both the category and statistics sections
+            name = frontmatter.get('name', '')
+            if isinstance(name, str) and ':' in name:
+                category = name.split(':', 1)[0]
+            else:
+                category = 'General'
+
             return {
                 'path': file_path,
                 'relative_path': file_path.relative_to(self.skills_dir),
-                'name': frontmatter.get('name', ''),
+                'name': name,
+                'category': category,
                 'description': frontmatter.get('description', ''),
                 'summary': summary,
                 'tools': frontmatter.get('allowed-tools', []),
@@ -75,9 +86,12 @@ class SkillCatalog:
             return skills
         return []
 
-    def load_all_skills(self):
-        """Load all skills into memory."""
-        for skill_file in self.find_all_skills():
+    def load_all_skills(self, skill_files: Optional[List[Path]] = None):
+        """Load all skills into memory, reusing an existing file list if given."""
+        if skill_files is None:
+            skill_files = self.find_all_skills()
+
+        for skill_file in skill_files:
             skill = self.parse_skill(skill_file)
             if skill and skill['name']:
                 self.skills.append(skill)
@@ -184,13 +198,7 @@ class SkillCatalog:
         categories = defaultdict(list)
 
         for skill in self.skills:
-            name = skill['name']
-            if ':' in name:
-                category = name.split(':', 1)[0]
-            else:
-                category = 'General'
-
-            categories[category].append(skill)
+            categories[skill['category']].append(skill)
 
         # Sort categories
         for category in sorted(categories.keys()):
@@ -213,22 +221,15 @@ class SkillCatalog:
         lines.append(f"- **Total Skills:** {total}")
 
         # Count by category
-        categories = defaultdict(int)
-        for skill in self.skills:
-            name = skill['name']
-            category = name.split(':', 1)[0] if ':' in name else 'General'
-            categories[category] += 1
+        categories = Counter(skill['category'] for skill in self.skills)
 
         lines.append(f"- **Categories:** {len(categories)}")
 
         # Most common tools
-        tool_counts = defaultdict(int)
-        for skill in self.skills:
-            for tool in skill['tools']:
-                tool_counts[tool] += 1
+        tool_counts = Counter(tool for skill in self.skills for tool in skill['tools'])
 
         if tool_counts:
-            top_tools = sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+            top_tools = tool_counts.most_common(5)
             lines.append("\n**Most Used Tools:**")
             for tool, count in top_tools:
                 lines.append(f"- `{tool}`: {count} skills")
@@ -273,7 +274,7 @@ class SkillCatalog:
             return 1
 
         print(f"Loading {len(skill_files)} skills...")
-        self.load_all_skills()
+        self.load_all_skills(skill_files)
 
         print(f"Generating catalog for {len(self.skills)} valid skills...")
         catalog = self.generate_catalog()
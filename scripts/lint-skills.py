@@ -15,6 +15,7 @@ Checks for:
 - Best practices compliance
 """
 
+import os
 import sys
 import re
 from pathlib import Path
@@ -22,6 +23,34 @@ from typing import Dict, List, Set, Optional
 import subprocess
 import yaml
 
+from skill_files import find_skill_files, walk_files
+
+# Recommended SKILL.md sections
+REQUIRED_SECTIONS = tuple(
+    re.compile(section, re.IGNORECASE)
+    for section in (
+        r'## When to Use',
+        r'## What This Skill Does',
+        r'## How to Use'
+    )
+)
+
+# Patterns applied to every skill, compiled once
+EXAMPLES_SECTION = re.compile(r'## Examples?', re.IGNORECASE)
+SECTION_HEADING = re.compile(r'^##\s+(.+)$', re.MULTILINE)
+MODULE_DOCSTRING = re.compile(r'""".*"""', re.DOTALL)
+TOP_HEADING = re.compile(r'^#\s+.+', re.MULTILINE)
+SCRIPTS_MENTION = re.compile(r'scripts?/', re.IGNORECASE)
+REFERENCES_MENTION = re.compile(r'references?/', re.IGNORECASE)
+CODE_FENCE = re.compile(r'```(\w*)')
+MARKDOWN_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# Script types checked for shebangs, permissions and docs
+SCRIPT_SUFFIXES = frozenset({'.py', '.sh', '.bash'})
+
+# Name fragments that suggest an overly generic skill
+GENERIC_NAMES = ('helper', 'utility', 'tool', 'general')
+
 
 class SkillLinter:
     def __init__(self, skills_dir: Path):
@@ -32,7 +61,7 @@ class SkillLinter:
 
     def find_all_skills(self) -> List[Path]:
         """Find all SKILL.md files recursively."""
-        return list(self.skills_dir.rglob('SKILL.md'))
+        return find_skill_files(self.skills_dir)
 
     def parse_frontmatter(self, file_path: Path) -> tuple[Optional[Dict], str]:
         """Extract and parse YAML frontmatter."""
@@ -53,27 +82,20 @@ class SkillLinter:
 
     def check_content_structure(self, file_path: Path, body: str) -> None:
         """Check SKILL.md content structure and quality."""
-        # Required sections
-        required_sections = [
-            r'## When to Use',
-            r'## What This Skill Does',
-            r'## How to Use'
-        ]
-
-        for section in required_sections:
-            if not re.search(section, body, re.IGNORECASE):
+        for section in REQUIRED_SECTIONS:
+            if not section.search(body):
                 self.warnings.append(
-                    f"{file_path}: Missing recommended section '{section}'"
+                    f"{file_path}: Missing recommended section '{section.pattern}'"
                 )
 
         # Check for examples section
-        if not re.search(r'## Examples?', body, re.IGNORECASE):
+        if not EXAMPLES_SECTION.search(body):
             self.warnings.append(
                 f"{file_path}: Missing Examples section (recommended)"
             )
 
         # Check for empty sections
-        sections = re.findall(r'^##\s+(.+)$', body, re.MULTILINE)
+        sections = SECTION_HEADING.findall(body)
         for section in sections:
             # Check if there's content after this section
             pattern = f'## {re.escape(section)}\\s*\\n\\s*(?:##|$)'
@@ -82,14 +104,11 @@ class SkillLinter:
                     f"{file_path}: Section '{section}' appears to be empty"
                 )
 
-    def check_scripts(self, skill_dir: Path) -> None:
+    def check_scripts(self, script_files: List[os.DirEntry]) -> None:
         """Check quality of bundled scripts."""
-        scripts_dir = skill_dir / 'scripts'
-        if not scripts_dir.exists():
-            return
-
-        for script_file in scripts_dir.rglob('*'):
-            if script_file.is_file() and script_file.suffix in ['.py', '.sh', '.bash']:
+        for entry in script_files:
+            script_file = Path(entry.path)
+            if script_file.suffix in SCRIPT_SUFFIXES:
                 # Check for shebang
                 content = script_file.read_text()
                 if not content.startswith('#!'):
@@ -98,25 +117,22 @@ class SkillLinter:
                     )
 
                 # Check if executable
-                if not script_file.stat().st_mode & 0o111:
+                if not entry.stat().st_mode & 0o111:
                     self.warnings.append(
                         f"{script_file}: Not executable (chmod +x needed)"
                     )
 
                 # Check for documentation
                 if script_file.suffix == '.py':
-                    if not re.search(r'""".*"""', content, re.DOTALL):
+                    if not MODULE_DOCSTRING.search(content):
                         self.warnings.append(
                             f"{script_file}: Missing module docstring"
                         )
 
-    def check_references(self, skill_dir: Path) -> None:
+    def check_references(self, ref_files: List[os.DirEntry]) -> None:
         """Check quality of reference documentation."""
-        refs_dir = skill_dir / 'references'
-        if not refs_dir.exists():
-            return
-
-        for ref_file in refs_dir.rglob('*.md'):
+        for entry in ref_files:
+            ref_file = Path(entry.path)
             content = ref_file.read_text()
 
             # Check for frontmatter in references
@@ -126,29 +142,30 @@ class SkillLinter:
                 )
 
             # Check for title
-            if not re.search(r'^#\s+.+', content, re.MULTILINE):
+            if not TOP_HEADING.search(content):
                 self.warnings.append(
                     f"{ref_file}: Missing top-level heading"
                 )
 
-    def check_best_practices(self, file_path: Path, frontmatter: Dict, body: str) -> None:
+    def check_best_practices(
+        self,
+        file_path: Path,
+        frontmatter: Dict,
+        body: str,
+        script_files: List[os.DirEntry],
+        ref_files: List[os.DirEntry],
+    ) -> None:
         """Check adherence to skill best practices."""
-        skill_dir = file_path.parent
-
         # Check for bundled resources mention
-        if (skill_dir / 'scripts').exists():
-            scripts = list((skill_dir / 'scripts').rglob('*'))
-            if scripts and not re.search(r'scripts?/', body, re.IGNORECASE):
-                self.info.append(
-                    f"{file_path}: Has scripts/ but doesn't mention them in SKILL.md"
-                )
+        if script_files and not SCRIPTS_MENTION.search(body):
+            self.info.append(
+                f"{file_path}: Has scripts/ but doesn't mention them in SKILL.md"
+            )
 
-        if (skill_dir / 'references').exists():
-            refs = list((skill_dir / 'references').rglob('*.md'))
-            if refs and not re.search(r'references?/', body, re.IGNORECASE):
-                self.info.append(
-                    f"{file_path}: Has references/ but doesn't mention them in SKILL.md"
-                )
+        if ref_files and not REFERENCES_MENTION.search(body):
+            self.info.append(
+                f"{file_path}: Has references/ but doesn't mention them in SKILL.md"
+            )
 
         # Check for clear use cases in description
         if frontmatter and 'description' in frontmatter:
@@ -163,8 +180,7 @@ class SkillLinter:
         # Check for overly generic names
         if frontmatter and 'name' in frontmatter:
             name = frontmatter['name']
-            generic_names = ['helper', 'utility', 'tool', 'general']
-            if any(gen in name.lower() for gen in generic_names):
+            if any(gen in name.lower() for gen in GENERIC_NAMES):
                 self.info.append(
                     f"{file_path}: Name '{name}' might be too generic"
                 )
@@ -172,7 +188,7 @@ class SkillLinter:
     def check_consistency(self, file_path: Path, body: str) -> None:
         """Check for consistency issues."""
         # Check for consistent code block formatting
-        code_blocks = re.findall(r'```(\w*)', body)
+        code_blocks = CODE_FENCE.findall(body)
         if code_blocks:
             # Check for unlabeled code blocks
             unlabeled = code_blocks.count('')
@@ -182,7 +198,7 @@ class SkillLinter:
                 )
 
         # Check for broken internal links
-        links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', body)
+        links = MARKDOWN_LINK.findall(body)
         for link_text, link_url in links:
             # Skip external links
             if link_url.startswith(('http://', 'https://', '#')):
@@ -204,11 +220,19 @@ class SkillLinter:
 
         skill_dir = file_path.parent
 
+        # Walk scripts/ and references/ once and share the listings;
+        # a missing directory simply yields no entries
+        script_files = walk_files(skill_dir / 'scripts')
+        ref_files = [
+            entry for entry in walk_files(skill_dir / 'references')
+            if entry.name.endswith('.md')
+        ]
+
         # Run all checks
         self.check_content_structure(file_path, body)
-        self.check_scripts(skill_dir)
-        self.check_references(skill_dir)
-        self.check_best_practices(file_path, frontmatter, body)
+        self.check_scripts(script_files)
+        self.check_references(ref_files)
+        self.check_best_practices(file_path, frontmatter, body, script_files, ref_files)
         self.check_consistency(file_path, body)
 
     def run(self) -> int:
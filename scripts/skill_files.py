@@ -0,0 +1,41 @@
+"""
+Shared file discovery and naming rules for the skills toolkit scripts.
+
+The scripts run from this directory, so they import it as a sibling module.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import List, Optional
+
+# Skill names: lowercase, digits, hyphens, and colons for namespaces
+NAME_PATTERN = re.compile(r'^[a-z0-9\-:]+$')
+
+
+def walk_files(directory: Path, name: Optional[str] = None) -> List[os.DirEntry]:
+    """List files under a directory, optionally only those called name.
+
+    scandir entries carry the file type from the directory read, so the walk
+    needs no stat per entry and builds no Path objects; entry.stat() still
+    costs one syscall on first use. Like Path.rglob, symlinked directories
+    are not descended into, and a missing directory yields no entries.
+    """
+    files = []
+    stack = [str(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (name is None or entry.name == name) and entry.is_file():
+                        files.append(entry)
+        except OSError:
+            continue
+    return files
+
+
+def find_skill_files(skills_dir: Path) -> List[Path]:
+    """Find all SKILL.md files recursively, sorted by path."""
+    return sorted(Path(entry.path) for entry in walk_files(skills_dir, 'SKILL.md'))
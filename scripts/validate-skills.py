@@ -16,12 +16,13 @@ Checks for:
 """
 
 import os
-import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, List, Set, Optional
 import yaml
 
+from skill_files import NAME_PATTERN, find_skill_files
+
 # Valid Claude Code tools
 VALID_TOOLS = {
     'Agent', 'Bash', 'Read', 'Write', 'Edit', 'Glob', 'Grep',
@@ -43,33 +44,45 @@ class SkillValidator:
         self.errors = []
         self.warnings = []
         self.skills_map = {}  # name -> path mapping
+        self.parsed = {}  # path -> frontmatter, parsed once per run
 
     def find_all_skills(self) -> List[Path]:
         """Find all SKILL.md files recursively."""
-        return list(self.skills_dir.rglob('SKILL.md'))
-
-    def parse_frontmatter(self, file_path: Path) -> Tuple[Optional[Dict], str]:
-        """Extract and parse YAML frontmatter from SKILL.md file."""
-        content = file_path.read_text()
-
-        # Check for frontmatter
-        if not content.startswith('---\n'):
-            return None, content
-
-        # Extract frontmatter
-        parts = content.split('---\n', 2)
-        if len(parts) < 3:
-            return None, content
-
-        frontmatter_str = parts[1]
-        body = parts[2]
+        return find_skill_files(self.skills_dir)
+
+    def parse_frontmatter(self, file_path: Path) -> Optional[Dict]:
+        """Extract and parse YAML frontmatter, reusing earlier results."""
+        if file_path not in self.parsed:
+            self.parsed[file_path] = self._load_frontmatter(file_path)
+        return self.parsed[file_path]
+
+    def _load_frontmatter(self, file_path: Path) -> Optional[Dict]:
+        """Extract and parse YAML frontmatter from SKILL.md file.
+
+        Validation never looks at the body, so reading stops at the closing
+        '---' instead of loading the whole file.
+        """
+        with open(file_path) as f:
+            # Check for frontmatter
+            if f.readline() != '---\n':
+                return None
+
+            # Extract frontmatter
+            lines = []
+            for line in f:
+                end = line.find('---\n')
+                if end != -1:
+                    lines.append(line[:end])
+                    break
+                lines.append(line)
+            else:
+                return None
 
         try:
-            frontmatter = yaml.safe_load(frontmatter_str)
-            return frontmatter, body
+            return yaml.safe_load(''.join(lines))
         except yaml.YAMLError as e:
             self.errors.append(f"{file_path}: Invalid YAML frontmatter: {e}")
-            return None, body
+            return None
 
     def validate_required_fields(self, file_path: Path, fm: Dict) -> None:
         """Check for required frontmatter fields."""
@@ -162,7 +175,7 @@ class SkillValidator:
         name = fm['name']
 
         # Check for valid characters (lowercase, hyphens, colons for namespaces)
-        if not re.match(r'^[a-z0-9\-:]+$', name):
+        if not NAME_PATTERN.match(name):
             self.warnings.append(f"{file_path}: Name should use lowercase, hyphens, and colons only")
 
         # Store for cross-reference validation
@@ -171,7 +184,7 @@ class SkillValidator:
     def validate_skill_file(self, file_path: Path) -> None:
         """Validate a single SKILL.md file."""
         # Parse frontmatter
-        frontmatter, body = self.parse_frontmatter(file_path)
+        frontmatter = self.parse_frontmatter(file_path)
 
         if frontmatter is None:
             self.errors.append(f"{file_path}: No frontmatter found or invalid YAML")
@@ -187,8 +200,9 @@ class SkillValidator:
 
     def validate_cross_references(self) -> None:
         """Validate that referenced skills actually exist."""
-        for skill_path in self.find_all_skills():
-            frontmatter, _ = self.parse_frontmatter(skill_path)
+        # Reuse the files and frontmatter from the first pass rather than
+        # walking and reading the skills directory again
+        for skill_path, frontmatter in self.parsed.items():
             if not frontmatter or 'skills' not in frontmatter:
                 continue
 
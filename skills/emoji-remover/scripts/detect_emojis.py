@@ -11,6 +11,8 @@ import sys
 from pathlib import Path
 from typing import Dict, List
 
+from text_files import iter_text_files, write_json_output
+
 # Unicode emoji ranges
 EMOJI_PATTERN = re.compile(
     "["
@@ -33,6 +35,9 @@ def find_emojis_in_file(filepath: Path) -> List[Dict]:
     try:
         with open(filepath, "r", encoding="utf-8") as f:
             for line_num, line in enumerate(f, 1):
+                # Skip lines that cannot contain an emoji
+                if line.isascii():
+                    continue
                 matches = EMOJI_PATTERN.finditer(line)
                 for match in matches:
                     # Get context (40 chars before and after)
@@ -58,15 +63,10 @@ def scan_directory(directory: Path, extensions: List[str]) -> Dict:
     """Scan directory for files containing emojis."""
     results = {}
 
-    for ext in extensions:
-        for filepath in directory.rglob(f"*{ext}"):
-            # Skip hidden files and directories
-            if any(part.startswith(".") for part in filepath.parts):
-                continue
-
-            emojis = find_emojis_in_file(filepath)
-            if emojis:
-                results[str(filepath.relative_to(directory))] = emojis
+    for filepath, rel_path in iter_text_files(directory, extensions):
+        emojis = find_emojis_in_file(filepath)
+        if emojis:
+            results[rel_path] = emojis
 
     return results
 
@@ -133,7 +133,10 @@ def main():
 
     results = scan_directory(args.directory, args.extensions)
     report = generate_report(results, args.json)
-    print(report)
+    if args.json:
+        write_json_output(report)
+    else:
+        print(report)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,8 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from text_files import iter_text_files, write_json_output
+
 # Emoji replacement mappings
 STATUS_REPLACEMENTS = {
     '✅': '[DONE]',
@@ -32,6 +34,15 @@ STATUS_REPLACEMENTS = {
     '🤖': 'AI:',
 }
 
+# Every status emoji in one alternation, longest first so multi-codepoint
+# sequences such as '⚠️' are matched whole
+STATUS_PATTERN = re.compile(
+    '|'.join(
+        re.escape(emoji)
+        for emoji in sorted(STATUS_REPLACEMENTS, key=len, reverse=True)
+    )
+)
+
 # Decorative emojis to remove entirely
 DECORATIVE_EMOJIS = re.compile(
     r'[🎉🎊💪👍🔥✨🌟⭐🎯🎨🏆🥇🎁🎈]+'
@@ -52,6 +63,10 @@ ALL_EMOJIS = re.compile(
 )
 
 
+# Runs of spaces left behind after removing emojis
+MULTI_SPACE = re.compile(r'  +')
+
+
 def is_in_code_block(line: str, in_block: bool) -> bool:
     """Check if we're inside a code block."""
     if line.strip().startswith('```'):
@@ -64,20 +79,24 @@ def replace_emojis_in_line(line: str, in_code_block: bool) -> Tuple[str, List[Di
     if in_code_block:
         return line, []
 
+    # ASCII-only lines have nothing to replace
+    if line.isascii():
+        return MULTI_SPACE.sub(' ', line), []
+
     changes = []
-    new_line = line
-
-    # First, replace known status emojis
-    for emoji, replacement in STATUS_REPLACEMENTS.items():
-        if emoji in new_line:
-            count = new_line.count(emoji)
-            new_line = new_line.replace(emoji, replacement)
-            for _ in range(count):
-                changes.append({
-                    'emoji': emoji,
-                    'replacement': replacement,
-                    'type': 'status'
-                })
+
+    def replace_status(match: re.Match) -> str:
+        emoji = match.group()
+        replacement = STATUS_REPLACEMENTS[emoji]
+        changes.append({
+            'emoji': emoji,
+            'replacement': replacement,
+            'type': 'status'
+        })
+        return replacement
+
+    # First, replace known status emojis in a single pass over the line
+    new_line = STATUS_PATTERN.sub(replace_status, line)
 
     # Then remove decorative emojis
     decorative_matches = DECORATIVE_EMOJIS.findall(new_line)
@@ -103,7 +122,7 @@ def replace_emojis_in_line(line: str, in_code_block: bool) -> Tuple[str, List[Di
         })
 
     # Clean up double spaces
-    new_line = re.sub(r'  +', ' ', new_line)
+    new_line = MULTI_SPACE.sub(' ', new_line)
 
     return new_line, changes
 
@@ -148,15 +167,10 @@ def process_directory(directory: Path, extensions: List[str], apply: bool = Fals
     """Process all files in directory."""
     results = {}
 
-    for ext in extensions:
-        for filepath in directory.rglob(f"*{ext}"):
-            # Skip hidden files
-            if any(part.startswith('.') for part in filepath.parts):
-                continue
-
-            result = process_file(filepath, apply)
-            if result.get('changes'):
-                results[str(filepath.relative_to(directory))] = result
+    for filepath, rel_path in iter_text_files(directory, extensions):
+        result = process_file(filepath, apply)
+        if result.get('changes'):
+            results[rel_path] = result
 
     return results
 
@@ -264,7 +278,7 @@ def main():
             'total_emojis': sum(r['total_emojis'] for r in results.values() if 'total_emojis' in r),
             'files': results
         }
-        print(json.dumps(output, indent=2))
+        write_json_output(json.dumps(output, indent=2))
     else:
         report = generate_report(results, apply)
         print(report)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Shared file discovery and output helpers for the emoji scripts.
+Imported by detect_emojis.py and remove_emojis.py; not meant to be run directly.
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+
+def iter_text_files(
+    directory: Path, extensions: List[str]
+) -> Iterator[Tuple[Path, str]]:
+    """Yield (path, relative path) for files matching any extension.
+
+    A single scandir walk checks every extension at once and prunes hidden
+    files and directories instead of descending into them. Relative paths
+    are built from the walk itself rather than via Path.relative_to.
+    """
+    suffixes = tuple(extensions)
+    stack = [(str(directory), "")]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                rel_path = rel_prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_path + os.sep))
+                elif entry.name.endswith(suffixes) and entry.is_file():
+                    yield Path(entry.path), rel_path
+
+
+def write_json_output(payload: str) -> None:
+    """Write a JSON document to stdout in a single call.
+
+    json.dumps output is ASCII-only by default, so it is encoded once and
+    written to the binary buffer, skipping the text layer.
+    """
+    sys.stdout.buffer.write(payload.encode("utf-8") + b"\n")
+    sys.stdout.buffer.flush()
@@ -6,6 +6,7 @@ Usage: python aggregate_benchmark.py --workspace iteration-1 --configs baseline
 
 import argparse
 import json
+import os
 import statistics
 from pathlib import Path
 from typing import Dict, List
@@ -75,15 +76,17 @@ def aggregate_config(workspace: Path, config: str, test_cases: List[Path]) -> Di
 def find_test_cases(workspace: Path) -> List[Path]:
     """Find all test case directories in workspace."""
     test_cases = []
-    for item in workspace.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
-            # Check if it has config subdirectories
-            has_configs = any(
-                (item / d).is_dir()
-                for d in ['baseline', 'treatment']
-            )
-            if has_configs:
-                test_cases.append(item)
+    with os.scandir(workspace) as entries:
+        for entry in entries:
+            # DirEntry.is_dir() reuses the type from the directory read
+            if entry.is_dir() and not entry.name.startswith('.'):
+                # Check if it has config subdirectories
+                has_configs = any(
+                    os.path.isdir(os.path.join(entry.path, d))
+                    for d in ['baseline', 'treatment']
+                )
+                if has_configs:
+                    test_cases.append(Path(entry.path))
     return sorted(test_cases)
 
 